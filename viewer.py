@@ -1,7 +1,17 @@
 """Claude Code History Viewer - browse your prompts from Claude Code sessions."""
 
+import contextlib
+import hashlib
 import json
+import mmap
+import os
+import pickle
 import sys
+import tempfile
+from array import array
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -9,12 +19,33 @@ from textual import on
 from textual.app import App
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
-from textual.widgets import Footer, Header, Input, Label, ListItem, ListView, Static
+from textual.timer import Timer
+from textual.widgets import DataTable, Footer, Header, Input, Label, Static
 from rich.text import Text
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Byte patterns every user prompt record contains. Claude Code writes compact
+# JSON, so checking for these before parsing lets us skip the (far more
+# common) assistant and system records without decoding them.
+_USER_TYPE_MARKER = b'"type":"user"'
+_USER_ROLE_MARKER = b'"role":"user"'
+# Tool results are sent back as user records too, and they carry the bulky
+# payloads (file contents, command output). One with no text block holds no
+# prompt, so it is skipped rather than decoded just to be thrown away.
+# Quotes inside JSON strings are escaped, so these only match real keys.
+_TOOL_RESULT_MARKER = b'"type":"tool_result"'
+_TEXT_BLOCK_MARKER = b'"type":"text"'
+
+
+@dataclass(slots=True)
 class Prompt:
     index: int
     text: str
@@ -23,72 +54,347 @@ class Prompt:
     cwd: str
     char_count: int = 0
     highlighted: bool = False
+    # Set when text is only a prefix: where the full record lives on disk.
+    source: Path | None = None
+    source_offset: int = 0
+    source_length: int = 0
+    text_lower: str = field(init=False, default="")
+    preview: str = field(init=False, default="")
 
     def __post_init__(self):
-        self.char_count = len(self.text)
+        if not self.char_count:
+            self.char_count = len(self.text)
+        self.text_lower = self.text.lower()
+        self.preview = self.text[:120].replace("\n", " ")
+
+
+def _user_record_lines(buf: mmap.mmap, offset: int = 0) -> Iterator[tuple[int, bytes]]:
+    """Yield (end, line) for lines of a JSONL buffer that may hold a user prompt.
 
+    Rather than visiting every line, jump straight to each occurrence of the
+    type marker and expand it to the surrounding line, so assistant and tool
+    records are skipped by the C-level search without ever being copied.
+    Scanning starts at ``offset``, which must be the start of a line.
+    """
+    pos = offset
+    while (hit := buf.find(_USER_TYPE_MARKER, pos)) != -1:
+        start = max(offset, buf.rfind(b"\n", offset, hit) + 1)
+        end = buf.find(b"\n", hit)
+        if end == -1:
+            end = len(buf)
+        if buf.find(_USER_ROLE_MARKER, start, end) != -1 and (
+            buf.find(_TOOL_RESULT_MARKER, start, end) == -1
+            or buf.find(_TEXT_BLOCK_MARKER, start, end) != -1
+        ):
+            yield end, buf[start:end]
+        pos = end + 1
+
+
+# (text, session_id, timestamp, cwd, char count, byte offset, byte length)
+# for one prompt. In low-memory mode text may be only a prefix, so the full
+# length travels separately.
+Record = tuple[str, str, str, str, int, int, int]
+
+# In low-memory mode, how much of each prompt's text is kept in memory.
+LOW_MEMORY_TEXT_CHARS = 512
+
+
+def _content_text(content) -> str:
+    """Flatten a user message's content into its stripped prompt text."""
+    # Most prompts are a plain string, so test for that first. Decoded JSON
+    # never holds subclasses, so exact type checks are safe and skip the MRO
+    # walk that isinstance does.
+    if type(content) is str:
+        return content.strip()
+    if type(content) is not list:
+        return ""
+    parts = []
+    for block in content:
+        if type(block) is dict:
+            if block.get("type") == "text":
+                parts.append(block["text"])
+        elif type(block) is str:
+            parts.append(block)
+    return "\n".join(parts).strip()
+
+
+def _parse_one(
+    jsonl_file: Path, offset: int = 0, text_limit: int | None = None
+) -> tuple[list[Record], int]:
+    """Extract prompt records from one JSONL file, starting at byte ``offset``.
+
+    Returns the records and the offset to resume from once more has been
+    appended: the end of the last complete line, or of a trailing line
+    without a newline if it already parses. Records are plain tuples rather
+    than Prompt objects so they are cheap to pickle back from workers. With
+    ``text_limit``, only that many characters of each prompt are kept, so the
+    full text never leaves the worker.
+    """
+    records = []
+    session_id = jsonl_file.stem[:8]
+    with open(jsonl_file, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap refuses empty files
+            return records, 0
+    with mm:
+        resume = max(offset, mm.rfind(b"\n", offset) + 1)
+        for end, line in _user_record_lines(mm, offset):
+            try:
+                obj = _json_loads(line)
+            except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+                continue
+            if end == len(mm):
+                # A complete record that is just missing its newline.
+                resume = end
+            if obj.get("type") != "user":
+                continue
+            msg = obj.get("message", {})
+            if msg.get("role") != "user":
+                continue
+            text = _content_text(msg.get("content", ""))
+            if not text:
+                continue
+            records.append(
+                (
+                    text[:text_limit],
+                    session_id,
+                    obj.get("timestamp", ""),
+                    obj.get("cwd", ""),
+                    len(text),
+                    end - len(line),
+                    len(line),
+                )
+            )
+    return records, resume
+
+
+def load_full_text(prompt: Prompt) -> str:
+    """Return a prompt's full text, rereading it from disk if only a prefix is held."""
+    if prompt.source is None:
+        return prompt.text
+    try:
+        with open(prompt.source, "rb") as f:
+            f.seek(prompt.source_offset)
+            obj = _json_loads(f.read(prompt.source_length))
+        return _content_text(obj["message"]["content"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # The file was rewritten since it was parsed; show what we kept.
+        return prompt.text
+
+
+# Below this many files, process start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 4
+
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks (e.g. containers)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+CACHE_DIR = Path.home() / ".cache" / "claude-code-history-viewer"
+# Bump when the shape of the cached records changes.
+_CACHE_VERSION = 4
+
+# filename -> ((mtime_ns, size), resume offset, records), as from _parse_one
+CacheEntries = dict[str, tuple[tuple[int, int], int, list[Record]]]
+
+
+def _cache_path(history_dir: Path, low_memory: bool) -> Path:
+    resolved = history_dir.resolve()
+    # The basename keeps the file recognisable; the hash keeps two directories
+    # with the same name (say, two "sessions/") from sharing one cache.
+    digest = hashlib.sha1(str(resolved).encode()).hexdigest()[:12]
+    # Low-memory records hold truncated text, so they get a cache of their own.
+    suffix = ".low-memory.pickle" if low_memory else ".pickle"
+    return CACHE_DIR / f"{resolved.name}-{digest}{suffix}"
+
+
+def load_cache(history_dir: Path, low_memory: bool = False) -> CacheEntries:
+    """Return the cached per-file records for a project, or {} if unusable."""
+    # The cache is disposable, so any failure to read it just means a reparse.
+    # A damaged pickle can raise nearly anything (MemoryError, OverflowError,
+    # KeyError, TypeError, ...), hence the broad except.
+    try:
+        with open(_cache_path(history_dir, low_memory), "rb") as f:
+            cache = pickle.load(f)
+        if (
+            type(cache) is not dict
+            or cache.get("version") != _CACHE_VERSION
+            or cache.get("dir") != str(history_dir.resolve())
+            or (low_memory and cache.get("text_limit") != LOW_MEMORY_TEXT_CHARS)
+        ):
+            return {}
+        files = cache["files"]
+        for (mtime_ns, size), resume, records in files.values():
+            if not (type(mtime_ns) is type(size) is type(resume) is int):
+                return {}
+            for text, session_id, timestamp, cwd, char_count, offset, length in records:
+                if type(text) is not str or type(session_id) is not str:
+                    return {}
+                if not (type(char_count) is type(offset) is type(length) is int):
+                    return {}
+    except Exception:
+        return {}
+    return files
+
+
+def save_cache(history_dir: Path, entries: CacheEntries, low_memory: bool = False) -> None:
+    """Atomically write the per-file records for a project. Failures are ignored."""
+    cache = {"version": _CACHE_VERSION, "dir": str(history_dir.resolve()), "files": entries}
+    if low_memory:
+        cache["text_limit"] = LOW_MEMORY_TEXT_CHARS
+    path = _cache_path(history_dir, low_memory)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=5)
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def parse_sessions(history_dir: Path, low_memory: bool = False) -> list[Prompt]:
+    """Parse all JSONL session files and extract user prompts.
+
+    Files whose mtime and size match the on-disk cache are not reparsed.
+    Session files are append-only, so a file that has grown is parsed from
+    where the cached scan stopped; one that has shrunk is parsed in full.
+
+    With ``low_memory``, prompts longer than LOW_MEMORY_TEXT_CHARS keep only
+    that prefix and remember where to reread the rest (see load_full_text).
+    Truncation happens as each record is parsed, and a separate cache holds
+    only prefixes, so peak memory while loading is bounded by the largest
+    single record rather than the total prompt text.
+    """
+    text_limit = LOW_MEMORY_TEXT_CHARS if low_memory else None
+    files = sorted(history_dir.glob("*.jsonl"))
+    cached = load_cache(history_dir, low_memory)
+    entries: CacheEntries = {}
+    stale = []
+    for jsonl_file in files:
+        st = jsonl_file.stat()
+        stat = (st.st_mtime_ns, st.st_size)
+        hit = cached.get(jsonl_file.name)
+        if hit is not None and hit[0] == stat:
+            entries[jsonl_file.name] = hit
+        elif hit is not None and stat[1] > hit[0][1]:
+            stale.append((jsonl_file, stat, hit[1], hit[2]))
+        else:
+            stale.append((jsonl_file, stat, 0, []))
+
+    stale_files = [jsonl_file for jsonl_file, _, _, _ in stale]
+    offsets = [offset for _, _, offset, _ in stale]
+    limits = [text_limit] * len(stale_files)
+    workers = min(_usable_cpus(), len(stale_files))
+    if len(stale_files) < _PARALLEL_MIN_FILES or workers == 1:
+        results = map(_parse_one, stale_files, offsets, limits)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_one, stale_files, offsets, limits, chunksize=4))
+    for (jsonl_file, stat, _, previous), (records, resume) in zip(stale, results):
+        entries[jsonl_file.name] = (stat, resume, previous + records)
+    if stale or len(entries) != len(cached):
+        save_cache(history_dir, entries, low_memory)
 
-def parse_sessions(history_dir: Path) -> list[Prompt]:
-    """Parse all JSONL session files and extract user prompts."""
     prompts = []
-    idx = 0
-    for jsonl_file in sorted(history_dir.glob("*.jsonl")):
-        session_id = jsonl_file.stem
-        with open(jsonl_file) as f:
-            for line in f:
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if obj.get("type") != "user":
-                    continue
-                msg = obj.get("message", {})
-                if msg.get("role") != "user":
-                    continue
-                content = msg.get("content", "")
-                if isinstance(content, list):
-                    parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            parts.append(block["text"])
-                        elif isinstance(block, str):
-                            parts.append(block)
-                    content = "\n".join(parts)
-                if not content.strip():
-                    continue
-                prompts.append(
-                    Prompt(
-                        index=idx,
-                        text=content.strip(),
-                        session_id=session_id[:8],
-                        timestamp=obj.get("timestamp", ""),
-                        cwd=obj.get("cwd", ""),
-                    )
+    for jsonl_file in files:
+        records = entries[jsonl_file.name][2]
+        for text, session_id, timestamp, cwd, char_count, offset, length in records:
+            prompts.append(
+                Prompt(
+                    index=len(prompts),
+                    text=text,
+                    # Interned here rather than in _parse_one: strings unpickled
+                    # from workers or the cache are fresh objects, even when equal.
+                    session_id=sys.intern(session_id),
+                    timestamp=timestamp,
+                    # cwd can be null in the log; don't let that abort the load
+                    cwd=sys.intern(cwd) if type(cwd) is str else "",
+                    char_count=char_count,
+                    source=jsonl_file if char_count > len(text) else None,
+                    source_offset=offset,
+                    source_length=length,
                 )
-                idx += 1
+            )
     return prompts
 
 
-class PromptItem(ListItem):
-    """A single prompt in the list."""
+# Below this many prompts a full scan takes well under the search debounce,
+# so the index is never built. Building costs as much CPU as a few hundred
+# scans, which pays off only as per-keystroke latency on huge histories.
+TRIGRAM_INDEX_MIN_PROMPTS = 100_000
 
-    def __init__(self, prompt: Prompt) -> None:
-        super().__init__()
-        self.prompt = prompt
 
-    def compose(self):
-        preview = self.prompt.text[:120].replace("\n", " ")
-        line = Text()
-        if self.prompt.highlighted:
-            line.append("* ", style="bold yellow")
-        else:
-            line.append("  ")
-        line.append(self.prompt.session_id, style="dim")
-        line.append(" ")
-        line.append(f"({self.prompt.char_count} chars)", style="cyan")
-        line.append("  ")
-        line.append(preview)
-        yield Static(line)
+def build_trigram_index(prompts: list[Prompt]) -> dict[str, array | None]:
+    """Map every 3-character substring of each prompt's text to prompt indices.
+
+    Postings are compact arrays of indices. A gram found in more than half of
+    all prompts narrows almost nothing, so it maps to None instead, meaning
+    "assume every prompt has it".
+    """
+    index: dict[str, array | None] = defaultdict(lambda: array("I"))
+    for p in prompts:
+        t = p.text_lower
+        for gram in {t[i : i + 3] for i in range(len(t) - 2)}:
+            index[gram].append(p.index)
+    common = len(prompts) // 2
+    for gram, ids in index.items():
+        if len(ids) > common:
+            index[gram] = None
+    return dict(index)
+
+
+def trigram_candidates(index: dict[str, array | None], tokens: list[str]) -> set[int] | None:
+    """Return indices of prompts that may contain every token.
+
+    Returns None when the tokens are too short or too common to narrow the search.
+    """
+    grams = {t[i : i + 3] for t in tokens for i in range(len(t) - 2)}
+    postings = [index.get(gram, ()) for gram in grams]
+    postings = sorted((ids for ids in postings if ids is not None), key=len)
+    if not postings:
+        return None
+    candidates = set(postings[0])
+    for ids in postings[1:]:
+        if not candidates:
+            break
+        candidates.intersection_update(ids)
+    return candidates
+
+
+def filter_prompts(prompts: list[Prompt], tokens: list[str]) -> list[Prompt]:
+    """Return the prompts whose lowercased text contains every token."""
+    if not tokens:
+        return prompts
+    if len(tokens) == 1:
+        token = tokens[0]
+        return [p for p in prompts if token in p.text_lower]
+    return [p for p in prompts if all(t in p.text_lower for t in tokens)]
+
+
+SEARCH_DEBOUNCE_SECONDS = 0.07
+
+
+def highlight_marker(prompt: Prompt) -> Text:
+    return Text("*", style="bold yellow") if prompt.highlighted else Text("")
+
+
+def prompt_row(prompt: Prompt) -> tuple[Text, Text, Text, Text]:
+    """Build the table cells (marker, session, chars, preview) for a prompt."""
+    return (
+        highlight_marker(prompt),
+        Text(prompt.session_id, style="dim"),
+        Text(str(prompt.char_count), style="cyan", justify="right"),
+        # Text, not str: DataTable would parse a plain string as Rich markup.
+        Text(prompt.preview),
+    )
 
 
 class HistoryViewer(App):
@@ -100,6 +406,9 @@ class HistoryViewer(App):
         width: 1fr;
         min-width: 40;
     }
+    #prompt-list {
+        height: 1fr;
+    }
     #preview-pane {
         width: 2fr;
         border-left: solid $accent;
@@ -145,6 +454,17 @@ class HistoryViewer(App):
         super().__init__()
         self.all_prompts = prompts
         self.filter_text = ""
+        # Built in the background on the first query that can use it
+        self._trigrams: dict[str, array | None] | None = None
+        self._trigrams_requested = False
+        # Prompt indices, longest first; sorted() is stable, so ties keep
+        # their natural order just as sorting with reverse=True would.
+        self._length_order = sorted(range(len(prompts)), key=lambda i: -prompts[i].char_count)
+        self._filter_timer: Timer | None = None
+        # Prompts in the order they appear as table rows
+        self._visible_prompts: list[Prompt] = []
+        # (lowercased filter, matching prompts) from the last filtered rebuild
+        self._filter_cache: tuple[str, list[Prompt]] | None = None
 
     def compose(self):
         yield Header(show_clock=True)
@@ -152,7 +472,7 @@ class HistoryViewer(App):
             yield Input(placeholder="Type to filter prompts...", id="search")
         with Horizontal(id="main"):
             with Vertical(id="list-pane"):
-                yield ListView(id="prompt-list")
+                yield DataTable(id="prompt-list", cursor_type="row")
             with Vertical(id="preview-pane"):
                 yield Label("Select a prompt to preview", id="preview-title")
                 yield Static("", id="preview-body")
@@ -161,25 +481,67 @@ class HistoryViewer(App):
 
     def on_mount(self):
         self.title = "Claude Code History Viewer"
+        table = self.query_one("#prompt-list", DataTable)
+        # Fixed width so toggling the marker in place never reflows the table
+        table.add_column("", width=1)
+        table.add_columns("Session", "Chars", "Prompt")
         self.rebuild_list()
 
     def get_visible_prompts(self) -> list[Prompt]:
         prompts = self.all_prompts
-        if self.show_only_highlighted:
+        ft = self.filter_text.lower()
+        # Anything matching the new filter also matched any prefix of it (each
+        # old token is a prefix of some new token), so narrow the previous
+        # result instead of rescanning everything. The cached list has already
+        # been through the highlighted-only filter.
+        if ft and self._filter_cache and ft.startswith(self._filter_cache[0]):
+            prompts = self._filter_cache[1]
+        elif self.show_only_highlighted:
             prompts = [p for p in prompts if p.highlighted]
-        if self.filter_text:
-            ft = self.filter_text.lower()
-            prompts = [p for p in prompts if ft in p.text.lower()]
+        if ft:
+            tokens = list(dict.fromkeys(ft.split()))
+            candidates = None
+            if self._trigrams is not None:
+                candidates = trigram_candidates(self._trigrams, tokens)
+            elif any(len(t) >= 3 for t in tokens):
+                self._request_trigram_index()
+            if candidates is not None:
+                if prompts is self.all_prompts:
+                    # parse_sessions numbers prompts by their list position
+                    prompts = [prompts[i] for i in sorted(candidates)]
+                else:
+                    prompts = [p for p in prompts if p.index in candidates]
+            prompts = filter_prompts(prompts, tokens)
+            self._filter_cache = (ft, prompts)
         if self.sort_by_length:
-            prompts = sorted(prompts, key=lambda p: p.char_count, reverse=True)
+            if prompts is self.all_prompts:
+                prompts = [prompts[i] for i in self._length_order]
+            else:
+                # Walking the full order would be O(N) however few prompts
+                # passed the filters; sorting the subset is cheaper, and
+                # stable, so ties come out in the same order.
+                prompts = sorted(prompts, key=lambda p: p.char_count, reverse=True)
         return prompts
 
+    def _request_trigram_index(self):
+        if self._trigrams_requested or len(self.all_prompts) < TRIGRAM_INDEX_MIN_PROMPTS:
+            return
+        self._trigrams_requested = True
+        self.run_worker(self._build_trigram_index, thread=True)
+
+    def _build_trigram_index(self):
+        # Filtering keeps scanning every prompt until this assignment lands.
+        self._trigrams = build_trigram_index(self.all_prompts)
+
+    def watch_show_only_highlighted(self):
+        self._filter_cache = None
+
     def rebuild_list(self):
-        lv = self.query_one("#prompt-list", ListView)
-        lv.clear()
+        table = self.query_one("#prompt-list", DataTable)
+        table.clear()
         visible = self.get_visible_prompts()
-        for p in visible:
-            lv.append(PromptItem(p))
+        self._visible_prompts = visible
+        table.add_rows(prompt_row(p) for p in visible)
         mode = []
         if self.show_only_highlighted:
             mode.append("highlighted only")
@@ -194,38 +556,45 @@ class HistoryViewer(App):
     @on(Input.Changed, "#search")
     def on_search_changed(self, event: Input.Changed):
         self.filter_text = event.value
-        self.rebuild_list()
+        # Coalesce a burst of keystrokes into one rebuild after the last one.
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(SEARCH_DEBOUNCE_SECONDS, self.rebuild_list)
 
-    @on(ListView.Selected, "#prompt-list")
-    def on_prompt_selected(self, event: ListView.Selected):
-        item = event.item
-        if isinstance(item, PromptItem):
-            self.show_preview(item.prompt)
+    @on(DataTable.RowSelected, "#prompt-list")
+    def on_prompt_selected(self, event: DataTable.RowSelected):
+        if event.cursor_row < len(self._visible_prompts):
+            self.show_preview(self._visible_prompts[event.cursor_row])
 
-    @on(ListView.Highlighted, "#prompt-list")
-    def on_prompt_highlighted(self, event: ListView.Highlighted):
-        item = event.item
-        if isinstance(item, PromptItem):
-            self.show_preview(item.prompt)
+    @on(DataTable.RowHighlighted, "#prompt-list")
+    def on_prompt_highlighted(self, event: DataTable.RowHighlighted):
+        if event.cursor_row < len(self._visible_prompts):
+            self.show_preview(self._visible_prompts[event.cursor_row])
 
     def show_preview(self, prompt: Prompt):
         star = " [highlighted]" if prompt.highlighted else ""
         title = Text()
         title.append(f"Session {prompt.session_id} | {prompt.char_count} chars{star}")
         self.query_one("#preview-title", Label).update(title)
-        self.query_one("#preview-body", Static).update(Text(prompt.text))
+        self.query_one("#preview-body", Static).update(Text(load_full_text(prompt)))
 
     def _get_current_prompt(self) -> Prompt | None:
-        lv = self.query_one("#prompt-list", ListView)
-        if lv.highlighted_child and isinstance(lv.highlighted_child, PromptItem):
-            return lv.highlighted_child.prompt
+        table = self.query_one("#prompt-list", DataTable)
+        if 0 <= table.cursor_row < len(self._visible_prompts):
+            return self._visible_prompts[table.cursor_row]
         return None
 
     def action_toggle_highlight(self):
         p = self._get_current_prompt()
         if p:
             p.highlighted = not p.highlighted
-            self.rebuild_list()
+            if self.show_only_highlighted:
+                # The prompt may need to leave the list, so rebuild it.
+                self._filter_cache = None
+                self.rebuild_list()
+            else:
+                table = self.query_one("#prompt-list", DataTable)
+                table.update_cell_at(Coordinate(table.cursor_row, 0), highlight_marker(p))
             self.show_preview(p)
 
     def action_show_highlighted_only(self):
@@ -251,8 +620,8 @@ class HistoryViewer(App):
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 
 
-def discover_projects() -> list[tuple[str, Path]]:
-    """Return (display_name, path) pairs for all projects in ~/.claude/projects/."""
+def discover_projects() -> list[tuple[str, str, Path]]:
+    """Return (display, display.lower(), path) for all projects in ~/.claude/projects/."""
     if not CLAUDE_PROJECTS_DIR.is_dir():
         return []
     projects = []
@@ -266,14 +635,14 @@ def discover_projects() -> list[tuple[str, Path]]:
         name = d.name
         prefix = f"-Users-{username}-"
         display = name[len(prefix):] if name.startswith(prefix) else name
-        projects.append((display, d))
+        projects.append((display, display.lower(), d))
     return projects
 
 
-def pick_project_interactive(projects: list[tuple[str, Path]]) -> Path:
+def pick_project_interactive(projects: list[tuple[str, str, Path]]) -> Path:
     """Print a numbered list and ask the user to pick one."""
     print("Claude Code projects found:\n")
-    for i, (name, _) in enumerate(projects, 1):
+    for i, (name, _, _) in enumerate(projects, 1):
         print(f"  {i:2}. {name}")
     print()
     while True:
@@ -281,21 +650,22 @@ def pick_project_interactive(projects: list[tuple[str, Path]]) -> Path:
             raw = input(f"Choose a project [1-{len(projects)}]: ").strip()
             idx = int(raw) - 1
             if 0 <= idx < len(projects):
-                return projects[idx][1]
+                return projects[idx][2]
         except (ValueError, EOFError):
             pass
         print(f"Please enter a number between 1 and {len(projects)}.")
 
 
-def find_project_by_name(name: str, projects: list[tuple[str, Path]]) -> Path | None:
+def find_project_by_name(name: str, projects: list[tuple[str, str, Path]]) -> Path | None:
     """Fuzzy-match a project name against the display names."""
     name_lower = name.lower()
-    # Exact match first
-    for display, path in projects:
-        if name_lower == display.lower():
+    # An exact match wins outright; otherwise fall back to substring matches.
+    matches = []
+    for display, display_lower, path in projects:
+        if name_lower == display_lower:
             return path
-    # Substring match
-    matches = [(display, path) for display, path in projects if name_lower in display.lower()]
+        if name_lower in display_lower:
+            matches.append((display, path))
     if len(matches) == 1:
         return matches[0][1]
     if len(matches) > 1:
@@ -312,6 +682,14 @@ def main():
     parser = argparse.ArgumentParser(description="Browse Claude Code session prompts")
     parser.add_argument("directory", nargs="?", help="Path to a session directory")
     parser.add_argument("-p", "--project", help="Project name to look up in ~/.claude/projects/")
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help=(
+            f"Keep only the first {LOW_MEMORY_TEXT_CHARS} characters of each prompt in memory "
+            "and reread the rest from disk for the preview. Search only sees the kept part."
+        ),
+    )
     args = parser.parse_args()
 
     if args.directory:
@@ -328,7 +706,7 @@ def main():
         if history_dir is None:
             print(f"No project matching '{args.project}' found.")
             print("Available projects:")
-            for display, _ in projects:
+            for display, _, _ in projects:
                 print(f"  {display}")
             sys.exit(1)
     else:
@@ -338,7 +716,7 @@ def main():
             sys.exit(1)
         history_dir = pick_project_interactive(projects)
 
-    prompts = parse_sessions(history_dir)
+    prompts = parse_sessions(history_dir, low_memory=args.low_memory)
     if not prompts:
         print("No user prompts found in the history files.")
         sys.exit(1)